@@ -1,7 +1,23 @@
+try:
+    from numba import njit, vectorize
+except ImportError:  # numba is optional; run as plain Python without it
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+    def vectorize(*args, **kwargs):
+        return lambda fn: fn
+
+
+# 'contract' lets LLVM fuse a*b + 1 into an FMA without the other fastmath
+# relaxations (NaN/inf handling of the a > b comparison stays strict).
+@njit(['int64(int64, int64)', 'float64(float64, float64)'], cache=True,
+      fastmath={'contract'})
 def add_mul(a, b):
     """
     Simple example function: if a > b return a*b + 1, else return a + b
-    Supports integers and floats.
+    Supports integers and floats. When numba is installed these are int64
+    and float64: ints outside the int64 range raise OverflowError and int64
+    results wrap around on overflow.
     """
     if a > b:
         return a * b + 1
@@ -9,12 +25,25 @@ def add_mul(a, b):
         return a + b
 
 
+@njit(['int64(int64, int64)', 'int64(float64, float64)'], cache=True)
 def is_sum_even(a, b):
     """
     Return 1 if the sum of a and b is even, otherwise 0.
     Kept intentionally simple w/ two parameters.
+    When numba is installed, arguments are int64/float64 and the result for
+    non-finite floats is undefined instead of raising.
     """
     if (int(a) + int(b)) % 2 == 0:
         return 1
     else:
         return 0
+
+
+@vectorize(['int8(int64, int64)', 'int8(float64, float64)'],
+           target='parallel', nopython=True)
+def is_sum_even_v(a, b):
+    """
+    Element-wise, branch-free `is_sum_even` for array inputs (a ufunc when
+    numba is installed, a scalar function otherwise).
+    """
+    return 1 - ((int(a) + int(b)) & 1)
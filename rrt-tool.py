@@ -12,164 +12,389 @@ in place of the original to check for semantic preservation.
 import argparse
 import ast
 import os
-import re
+import py_compile
 import sys
-import textwrap
+import importlib.machinery
+import io
+import keyword
 import importlib.util
+import math
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from multiprocessing import Pool
 import unittest
 
-# Pattern to match simple C/Java: if (COND) { return TRUE; } else { return FALSE; }
-# This is intentionally simple and does not handle nested braces or semicolons inside expressions.
-IF_RETURN_PATTERN = re.compile(r"""
-    if\s*\(\s*(?P<cond>.*?)\s*\)\s*  # if (cond)
-    \{\s*return\s+(?P<true>[^;]+);\s*\}  # { return true; }
-    \s*else\s*\{\s*return\s+(?P<false>[^;]+);\s*\}  # else { return false; }
-""", re.DOTALL | re.VERBOSE)
-
-
-def parse_python_function(path, fn_name=None):
-    src = open(path, 'r', encoding='utf-8').read()
-    tree = ast.parse(src)
-    first = None
-    for node in tree.body:
-        if isinstance(node, ast.FunctionDef):
-            if first is None:
-                first = node
-            if fn_name is None:
-                name = node.name
-                args = [a.arg for a in node.args.args]
-                return {
-                    'name': name,
-                    'args': args,
-                    'ast': node,
-                    'src': src,
-                }
-            if node.name == fn_name:
-                name = node.name
-                args = [a.arg for a in node.args.args]
-                return {
-                    'name': name,
-                    'args': args,
-                    'ast': node,
-                    'src': src,
-                }
-    if fn_name is not None and first is not None:
+
+def scan_if_return(text):
+    """
+    Locate `if (COND) { return TRUE; } else { return FALSE; }` in generated
+    C/Java text by peeling it apart with str.partition (no regex). Returns a
+    `(cond, true, false)` tuple of stripped source slices, or None.
+    This is intentionally simple and relies on the layout our generators
+    emit; it does not handle nested braces or semicolons inside expressions.
+    """
+    _, found, rest = text.partition('if (')
+    if not found:
+        return None
+    cond, found, rest = rest.partition(') {')
+    if not found:
+        return None
+    _, found, rest = rest.partition('return ')
+    if not found:
+        return None
+    true_ret, found, rest = rest.partition(';')
+    if not found:
+        return None
+    _, found, rest = rest.partition('else')
+    if not found:
+        return None
+    _, found, rest = rest.partition('return ')
+    if not found:
+        return None
+    false_ret, found, _ = rest.partition(';')
+    if not found:
+        return None
+    return cond.strip(), true_ret.strip(), false_ret.strip()
+
+
+def read_all(path):
+    # Source files here are tiny: size the buffer from fstat and slurp the
+    # file with a raw os.read, skipping the buffered io stack. Asking for one
+    # extra byte lets that single read also detect end of file.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if data and len(data) != size:
+            # Short read (allowed by POSIX, e.g. NFS/FUSE or a signal) or more
+            # data than fstat reported (growing file, /proc, pipes): read on
+            # until os.read signals end of file
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b''.join(chunks)
+    finally:
+        os.close(fd)
+    return data
+
+
+def parse_python_function(path, fn_name=None, fast=False):
+    # Parse the raw bytes; the compiler handles the encoding itself
+    src = read_all(path)
+    if fast:
+        info = mini_parse(src, fn_name, path)
+        if info is not None:
+            return info
+    tree = ast.parse(src, filename=path)
+    funcs = [n for n in tree.body if isinstance(n, ast.FunctionDef)]
+    # First function, or the first one named fn_name
+    node = next((n for n in funcs if fn_name is None or n.name == fn_name), None)
+    if node is not None:
+        return function_info(node, src)
+    if fn_name is not None and funcs:
         raise RuntimeError(f"Function '{fn_name}' not found in {path}")
     raise RuntimeError('No function found in {}'.format(path))
 
 
-def expr_to_source(expr):
+def mini_parse(src, fn_name=None, path='<fast-parse>'):
+    """
+    Recognize the micro-grammar the translator supports with plain string
+    operations instead of walking and rendering the AST:
+
+        def NAME(ARGS):
+            [docstring]
+            if COND:
+                return TRUE
+            else:
+                return FALSE
+
+    Returns the same info dict as function_info (with no AST nodes), or None
+    when the source does not fit that shape so the caller can fall back to
+    the ast-based parser. The file must still compile, so invalid sources
+    are rejected exactly as on the ast path.
+    """
+    # Honour a PEP 263 coding cookie like the real parser does
     try:
-        return ast.unparse(expr)
-    except Exception:
-        return '<expr>'
-
-
-def generate_c_code(info):
-    # This generator handles the simple pattern used by `add_mul`.
-    name = info['name']
-    args = info['args']
-    params = ', '.join(f'double {arg}' for arg in args)
-    # Attempt to extract the condition and two return expressions
-    node = info['ast']
-    if_stmt = None
-    for n in node.body:
-        if isinstance(n, ast.If):
-            if_stmt = n
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(src).readline)
+        lines = src.decode(encoding).splitlines()
+    except (SyntaxError, UnicodeDecodeError):
+        return None
+    open_quote = None
+    for i, line in enumerate(lines):
+        # Skip `def` lines that sit inside a top-level triple-quoted string
+        if open_quote is None and line.startswith('def '):
+            info = _mini_parse_def(lines, i, fn_name)
+            if info is not None:
+                break
+        open_quote = _track_triple_quotes(line, open_quote)
+    else:
+        return None
+    if info is False:
+        return None
+    # Reject sources Python itself rejects, wherever the error is
+    compile(src, path, 'exec', ast.PyCF_ONLY_AST)
+    info['src'] = src
+    return info
+
+
+def _track_triple_quotes(line, open_quote):
+    # Returns the triple quote still open at the end of `line`, if any
+    pos = 0
+    while True:
+        if open_quote is None:
+            hits = [(line.find(q, pos), q) for q in ('"""', "'''")]
+            hits = [(at, q) for at, q in hits if at >= 0]
+            if not hits:
+                return None
+            pos, open_quote = min(hits)
+        else:
+            pos = line.find(open_quote, pos)
+            if pos < 0:
+                return open_quote
+            open_quote = None
+        pos += 3
+
+
+def _is_name(name):
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _mini_parse_def(lines, i, fn_name):
+    # None: not the function we want, keep looking; False: it is, but the
+    # shortcut cannot handle it
+    line = lines[i]
+    name, _, rest = line[4:].partition('(')
+    name = name.strip()
+    if fn_name is not None and name != fn_name:
+        return None
+    params, found, tail = rest.partition(')')
+    args = [p.strip() for p in params.split(',') if p.strip()]
+    if not found or tail.strip() != ':' or not _is_name(name) \
+            or not all(_is_name(a) for a in args):
+        return False
+    # Body: the indented (or blank) lines up to the next top-level line,
+    # as (indent width, stripped text)
+    stmts = []
+    for body_line in lines[i + 1:]:
+        text = body_line.strip()
+        if text and not body_line[0].isspace():
             break
-    if if_stmt is None:
-        raise RuntimeError('Unsupported function body for C generation')
-    cond = expr_to_source(if_stmt.test)
-    true_ret = expr_to_source(if_stmt.body[0].value)
-    false_ret = expr_to_source(if_stmt.orelse[0].value)
-    c = textwrap.dedent(f"""
-    #include <stdio.h>
+        if text:
+            indent = body_line[:len(body_line) - len(body_line.lstrip())]
+            if '\t' in indent:
+                return False
+            stmts.append((len(indent), text))
+    if stmts and stmts[0][1][:3] in ('"""', "'''"):
+        quote = stmts[0][1][:3]
+        if quote in stmts[0][1][3:]:
+            end = 0
+        else:
+            end = next((j for j in range(1, len(stmts)) if quote in stmts[j][1]), None)
+            if end is None:
+                return False
+        stmts = stmts[end + 1:]
+    if len(stmts) != 4 or any('#' in st or ';' in st for _, st in stmts):
+        return False
+    (if_indent, if_line), (true_indent, true_line), \
+        (else_indent, else_line), (false_indent, false_line) = stmts
+    if not (if_line.startswith('if ') and if_line.endswith(':')
+            and true_line.startswith('return ') and else_line == 'else:'
+            and false_line.startswith('return ')):
+        return False
+    # `if`/`else` share the body indent; each `return` is nested deeper
+    if else_indent != if_indent or true_indent <= if_indent or false_indent <= if_indent:
+        return False
+    cond = if_line[3:-1].strip()
+    true_ret = true_line[7:].strip()
+    false_ret = false_line[7:].strip()
+    # The slices go verbatim into C/Java, so make sure each one is a
+    # complete Python expression before trusting the shortcut
+    try:
+        for expr in (cond, true_ret, false_ret):
+            compile(expr, '<fast-parse>', 'eval', ast.PyCF_ONLY_AST)
+    except SyntaxError:
+        return False
+    return {
+        'name': name,
+        'args': [sys.intern(a) for a in args],
+        'ast': None,
+        'src': None,
+        'if': None,
+        'cond': cond,
+        'true': true_ret,
+        'false': false_ret,
+    }
+
+
+def function_info(node, src):
+    """
+    Build the translator's view of a parsed function. The `if`/`else` return
+    expressions are rendered once here so each backend generator only has to
+    format them.
+    """
+    if_stmt = next((n for n in node.body if isinstance(n, ast.If)), None)
+    info = {
+        'name': node.name,
+        'args': [sys.intern(a.arg) for a in node.args.args],
+        'ast': node,
+        'src': src,  # raw bytes; decode('utf-8') if text is needed
+        'if': if_stmt,
+        'cond': None,
+        'true': None,
+        'false': None,
+    }
+    if if_stmt is not None:
+        info['cond'] = render_expr(if_stmt.test)
+        info['true'] = render_expr(if_stmt.body[0].value)
+        info['false'] = render_expr(if_stmt.orelse[0].value)
+    return info
+
+
+# Operator symbols and binding strength for the shapes render_expr handles
+# directly; anything else falls back to ast.unparse.
+_CMP_OPS = {ast.Gt: '>', ast.Lt: '<', ast.GtE: '>=', ast.LtE: '<=',
+            ast.Eq: '==', ast.NotEq: '!='}
+_BIN_OPS = {ast.Add: ('+', 1), ast.Sub: ('-', 1), ast.Mult: ('*', 2),
+            ast.Div: ('/', 2), ast.FloorDiv: ('//', 2), ast.Mod: ('%', 2)}
+_CMP_PREC = 0
+_ATOM_PREC = 3
+_ATOMS = (ast.Name, ast.Constant, ast.Call, ast.Attribute, ast.Subscript)
+
+
+def render_expr(expr):
+    """
+    Render the simple expressions our functions use (names, numbers,
+    arithmetic and comparisons) without the generic ast.unparse walk.
+    """
+    return _render(expr)[0]
+
+
+def _render(expr):
+    # Returns (source, precedence) so parents know when to parenthesize
+    if isinstance(expr, ast.Name):
+        return expr.id, _ATOM_PREC
+    if isinstance(expr, ast.Constant) and (
+            type(expr.value) is int
+            or (type(expr.value) is float and math.isfinite(expr.value))):
+        return repr(expr.value), _ATOM_PREC
+    if isinstance(expr, ast.BinOp) and type(expr.op) in _BIN_OPS:
+        sym, prec = _BIN_OPS[type(expr.op)]
+        left = _operand(expr.left, prec)
+        right = _operand(expr.right, prec + 1)
+        return f'{left} {sym} {right}', prec
+    if isinstance(expr, ast.Compare) and all(type(op) in _CMP_OPS for op in expr.ops):
+        parts = [_operand(expr.left, _CMP_PREC + 1)]
+        for op, comparator in zip(expr.ops, expr.comparators):
+            parts.append(_CMP_OPS[type(op)])
+            parts.append(_operand(comparator, _CMP_PREC + 1))
+        return ' '.join(parts), _CMP_PREC
+    # Unknown shape: let ast.unparse handle it, and parenthesize it when
+    # nested unless it is known to bind tighter than any operator above.
+    return ast.unparse(expr), (_ATOM_PREC if isinstance(expr, _ATOMS) else -1)
+
+
+def _operand(expr, min_prec):
+    src, prec = _render(expr)
+    return src if prec >= min_prec else f'({src})'
+
+
+# Code templates: everything except the function name, parameters and the
+# three expressions is fixed, so they are built once at import.
+C_TEMPLATE = """
+#include <stdio.h>
+
+double {name}({params}) {{
+    if ({cond}) {{
+        return {true_ret};
+    }} else {{
+        return {false_ret};
+    }}
+}}
 
-    double {name}({params}) {{
+int main(void) {{
+    // Example driver (not used by the Python round-trip)
+    return 0;
+}}
+"""
+
+JAVA_TEMPLATE = """
+public class Original {{
+    public static double {name}({params}) {{
         if ({cond}) {{
             return {true_ret};
         }} else {{
             return {false_ret};
         }}
     }}
+}}
+"""
 
-    int main(void) {{
-        // Example driver (not used by the Python round-trip)
-        return 0;
-    }}
-    """)
-    return c
+PY_TEMPLATE = """
+def {name}({params}):
+    if {cond}:
+        return {true_ret}
+    else:
+        return {false_ret}
+"""
+
+
+def generate_c_code(info):
+    # This generator handles the simple pattern used by `add_mul`.
+    if info['cond'] is None:
+        raise RuntimeError('Unsupported function body for C generation')
+    params = ', '.join(f'double {arg}' for arg in info['args'])
+    return C_TEMPLATE.format(name=info['name'], params=params, cond=info['cond'],
+                             true_ret=info['true'], false_ret=info['false'])
 
 
 def generate_java_code(info):
-    name = info['name']
-    args = info['args']
-    params = ', '.join(f'double {arg}' for arg in args)
-    node = info['ast']
-    if_stmt = None
-    for n in node.body:
-        if isinstance(n, ast.If):
-            if_stmt = n
-            break
-    if if_stmt is None:
+    if info['cond'] is None:
         raise RuntimeError('Unsupported function body for Java generation')
-    cond = expr_to_source(if_stmt.test)
-    true_ret = expr_to_source(if_stmt.body[0].value)
-    false_ret = expr_to_source(if_stmt.orelse[0].value)
-    java = textwrap.dedent(f"""
-    public class Original {{
-        public static double {name}({params}) {{
-            if ({cond}) {{
-                return {true_ret};
-            }} else {{
-                return {false_ret};
-            }}
-        }}
-    }}
-    """)
-    return java
+    params = ', '.join(f'double {arg}' for arg in info['args'])
+    return JAVA_TEMPLATE.format(name=info['name'], params=params, cond=info['cond'],
+                                true_ret=info['true'], false_ret=info['false'])
+
 
+def generate_python_code(info):
+    # Emit the round-tripped Python straight from the parsed function,
+    # producing the same text c_to_python/java_to_python recover when given
+    # the function's name and parameters.
+    if info['cond'] is None:
+        raise RuntimeError('Unsupported function body for Python generation')
+    return PY_TEMPLATE.format(name=info['name'], params=', '.join(info['args']),
+                              cond=info['cond'], true_ret=info['true'], false_ret=info['false'])
 
-def c_to_python(c_text, py_name='add_mul'):
+
+@lru_cache(maxsize=64)
+def c_to_python(c_text, py_name='add_mul', py_params='a, b'):
     # Super simple pattern extraction for C code
     # Basically find if (cond) { return X; } else { return Y; }
-    m = IF_RETURN_PATTERN.search(c_text)
-    if not m:
+    parts = scan_if_return(c_text)
+    if parts is None:
         raise RuntimeError('Could not parse C text')
-    cond = m.group('cond').strip()
-    true_ret = m.group('true').strip()
-    false_ret = m.group('false').strip()
+    cond, true_ret, false_ret = parts
     # Convert C operators to Python-friendly forms if needed
-    py = textwrap.dedent(f"""
-    def {py_name}(a, b):
-        if {cond}:
-            return {true_ret}
-        else:
-            return {false_ret}
-    """)
-    return py
+    return PY_TEMPLATE.format(name=py_name, params=py_params, cond=cond,
+                              true_ret=true_ret, false_ret=false_ret)
 
 
-def java_to_python(java_text, py_name='add_mul'):
+@lru_cache(maxsize=64)
+def java_to_python(java_text, py_name='add_mul', py_params='a, b'):
     # Similar simple extraction from generated Java
-    m = IF_RETURN_PATTERN.search(java_text)
-    if not m:
+    parts = scan_if_return(java_text)
+    if parts is None:
         raise RuntimeError('Could not parse Java text')
-    cond = m.group('cond').strip()
-    true_ret = m.group('true').strip()
-    false_ret = m.group('false').strip()
-    py = textwrap.dedent(f"""
-    def {py_name}(a, b):
-        if {cond}:
-            return {true_ret}
-        else:
-            return {false_ret}
-    """)
-    return py
+    cond, true_ret, false_ret = parts
+    return PY_TEMPLATE.format(name=py_name, params=py_params, cond=cond,
+                              true_ret=true_ret, false_ret=false_ret)
 
 
 def write_file(path, text):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # The parent directory must already exist (main() creates outdir once)
     with open(path, 'w', encoding='utf-8') as f:
         f.write(text)
 
@@ -182,21 +407,82 @@ def load_module_as_original(path):
     return module
 
 
-def run_unittests(tests_dir='tests'):
+# Only the tests of the translated `original` module judge a round-trip;
+# the tool's own tests (tests/test_rrt_tool.py) are left out
+ORIGINAL_TESTS = 'test_original*.py'
+
+# Test module names imported by the last discovery of each (tests_dir, pattern)
+_discovered_modules = {}
+
+
+def iter_test_cases(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_test_cases(test)
+        else:
+            yield test
+
+
+def build_suite(tests_dir='tests', pattern=ORIGINAL_TESTS):
+    # Test modules bind names via `from original import ...` when imported,
+    # so drop the ones a previous run imported; otherwise discovery would
+    # reuse them and test whichever `original` was loaded first. This is
+    # also why the suite itself is rebuilt rather than memoized.
+    for name in _discovered_modules.pop((tests_dir, pattern), ()):
+        sys.modules.pop(name, None)
     loader = unittest.TestLoader()
-    suite = loader.discover(start_dir=tests_dir)
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    suite = loader.discover(start_dir=tests_dir, pattern=pattern)
+    root = os.path.abspath(tests_dir) + os.sep
+    _discovered_modules[tests_dir, pattern] = {
+        name for name in {type(t).__module__ for t in iter_test_cases(suite)}
+        if os.path.abspath(getattr(sys.modules.get(name), '__file__', None) or '').startswith(root)
+    }
+    return suite
+
+
+def run_unittests(tests_dir='tests', verbose=False, stream=None, pattern=ORIGINAL_TESTS):
+    # Reports go to `stream` (default: stdout)
+    stream = sys.stdout if stream is None else stream
+    suite = build_suite(tests_dir, pattern)
+    if verbose:
+        return unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    # Quiet path: collect results without per-test formatting, and only
+    # report the tests that went wrong
+    result = unittest.TestResult()
+    suite.run(result)
+    for test, err in result.errors:
+        print(f'ERROR: {test.id()}\n{err}', file=stream)
+    for test, err in result.failures:
+        print(f'FAIL: {test.id()}\n{err}', file=stream)
+    for test in result.unexpectedSuccesses:
+        print(f'UNEXPECTED SUCCESS: {test.id()}', file=stream)
+    print(f'Ran {result.testsRun} tests: {"OK" if result.wasSuccessful() else "FAILED"}', file=stream)
     return result
 
 
-def run_tests_with_module(module_path, tests_dir='tests'):
+def run_tests_with_module(module_path, tests_dir='tests', verbose=False):
     # Load the provided module under the name 'original' so tests import it
     load_module_as_original(module_path)
-    return run_unittests(tests_dir)
+    return run_unittests(tests_dir, verbose=verbose)
+
+
+# Compiled `original` sources keyed by (path, mtime). This only pays off for
+# in-process callers running several round-trips; the CLI runs each one in a
+# fresh Pool worker, so its --run-tests path never hits the cache.
+_orig_code_cache = {}
+
 
+def compile_original(path):
+    key = (path, os.stat(path).st_mtime_ns)
+    code = _orig_code_cache.get(key)
+    if code is None:
+        code = compile(read_all(path), path, 'exec')
+        _orig_code_cache[key] = code
+    return code
 
-def run_tests_with_roundtrip(roundtrip_path, original_source='original.py', tests_dir='tests'):
+
+def run_tests_with_roundtrip(roundtrip_path, original_source='original.py', tests_dir='tests',
+                             verbose=False, stream=None):
     """
     Load the real `original` module from `original_source`, then execute the
     round-tripped Python file into that module's namespace so the translated
@@ -207,13 +493,26 @@ def run_tests_with_roundtrip(roundtrip_path, original_source='original.py', test
     spec = importlib.util.spec_from_file_location('original', original_source)
     module = importlib.util.module_from_spec(spec)
     sys.modules['original'] = module
-    spec.loader.exec_module(module)
+    exec(compile_original(original_source), module.__dict__)
+
+    # Execute round-tripped code into the same module; the source loader
+    # reuses the .pyc primed by main() instead of recompiling
+    rt_loader = importlib.machinery.SourceFileLoader('original', roundtrip_path)
+    exec(rt_loader.get_code('original'), module.__dict__)
 
-    # Read and execute round-tripped code into the same module 
-    rt_src = open(roundtrip_path, 'r', encoding='utf-8').read()
-    exec(compile(rt_src, roundtrip_path, 'exec'), module.__dict__)
+    return run_unittests(tests_dir, verbose=verbose, stream=stream)
 
-    return run_unittests(tests_dir)
+
+def run_one_roundtrip(job):
+    # Pool worker entry point:
+    # (roundtrip_path, original_source, verbose) -> (passed, report text).
+    # The report is captured rather than printed so the parent can show the
+    # two concurrent runs one after the other.
+    roundtrip_path, original_source, verbose = job
+    stream = io.StringIO()
+    result = run_tests_with_roundtrip(roundtrip_path, original_source=original_source,
+                                      verbose=verbose, stream=stream)
+    return result.wasSuccessful(), stream.getvalue()
 
 
 def main():
@@ -222,27 +521,40 @@ def main():
     p.add_argument('--outdir', default='build', help='Output directory for generated code')
     p.add_argument('--func', '--fn', dest='fn', help='Function name to process (defaults to first function)')
     p.add_argument('--run-tests', action='store_true', help='Run tests on round-tripped modules')
+    p.add_argument('--skip-parse', action='store_true',
+                   help='Emit round-tripped Python from the parsed function instead of re-parsing the generated C/Java')
+    p.add_argument('--fast-parse', action='store_true',
+                   help='Recognize simple if/else functions with string operations instead of walking the AST '
+                        '(the file is still syntax-checked; falls back to ast otherwise)')
+    p.add_argument('--verbose', action='store_true', help='Print every test result when running tests')
     args = p.parse_args()
 
-    info = parse_python_function(args.source, fn_name=args.fn)
+    info = parse_python_function(args.source, fn_name=args.fn, fast=args.fast_parse)
 
     c_code = generate_c_code(info)
     java_code = generate_java_code(info)
 
     outdir = args.outdir
+    os.makedirs(outdir, exist_ok=True)
     c_path = os.path.join(outdir, 'original.c')
     java_path = os.path.join(outdir, 'Original.java')
-    write_file(c_path, c_code)
-    write_file(java_path, java_code)
 
     # Round-trip back to Python
-    py_from_c = c_to_python(c_code, py_name=info['name'])
-    py_from_java = java_to_python(java_code, py_name=info['name'])
+    if args.skip_parse:
+        py_from_c = py_from_java = generate_python_code(info)
+    else:
+        py_params = ', '.join(info['args'])
+        py_from_c = c_to_python(c_code, py_name=info['name'], py_params=py_params)
+        py_from_java = java_to_python(java_code, py_name=info['name'], py_params=py_params)
 
     py_c_path = os.path.join(outdir, 'original_from_c.py')
     py_java_path = os.path.join(outdir, 'original_from_java.py')
-    write_file(py_c_path, py_from_c)
-    write_file(py_java_path, py_from_java)
+
+    # The four writes are independent, so let them overlap
+    paths = [c_path, java_path, py_c_path, py_java_path]
+    texts = [c_code, java_code, py_from_c, py_from_java]
+    with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+        list(ex.map(write_file, paths, texts))
 
     print('Generated:')
     print(' -', c_path)
@@ -252,12 +564,23 @@ def main():
     print(' -', py_java_path)
 
     if args.run_tests:
-        print('\nRunning tests with C-derived module...')
-        res_c = run_tests_with_roundtrip(py_c_path, original_source=args.source)
-        print('\nRunning tests with Java-derived module...')
-        res_j = run_tests_with_roundtrip(py_java_path, original_source=args.source)
-
-        preserved = res_c.wasSuccessful() and res_j.wasSuccessful()
+        # Prime the bytecode the test runs load the round-tripped modules from
+        py_compile.compile(py_c_path, doraise=True)
+        py_compile.compile(py_java_path, doraise=True)
+
+        # The two runs share no state, so test them in separate processes;
+        # each child also gets its own sys.modules['original']
+        print('\nRunning tests with C-derived and Java-derived modules...')
+        sys.stdout.flush()
+        jobs = [(py_c_path, args.source, args.verbose), (py_java_path, args.source, args.verbose)]
+        with Pool(2) as pool:
+            (ok_c, report_c), (ok_j, report_j) = pool.map(run_one_roundtrip, jobs)
+        for label, ok, report in (('C-derived', ok_c, report_c), ('Java-derived', ok_j, report_j)):
+            print(f'\n{label} module:')
+            print(report, end='')
+            print(f'{label} module:', 'passed' if ok else 'FAILED')
+
+        preserved = ok_c and ok_j
         if preserved:
             print('\nResult: translations PRESERVED logical meaning (tests passed).')
             sys.exit(0)
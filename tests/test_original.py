@@ -1,5 +1,6 @@
+import importlib.util
 import unittest
-from original import add_mul, is_sum_even
+from original import add_mul, is_sum_even, is_sum_even_v
 
 
 class TestAddMul(unittest.TestCase):
@@ -12,6 +13,16 @@ class TestAddMul(unittest.TestCase):
     def test_equal(self):
         self.assertEqual(add_mul(0, 0), 0 + 0)
 
+    @unittest.skipIf(importlib.util.find_spec('numba'), 'numba limits add_mul to int64')
+    def test_big_ints_exact_in_python(self):
+        self.assertEqual(add_mul(10 ** 20, 1), 10 ** 20 + 1)
+
+    @unittest.skipUnless(importlib.util.find_spec('numba'), 'int64 domain only applies under numba')
+    def test_int64_domain_under_numba(self):
+        self.assertEqual(add_mul(2 ** 62, 4), 1)  # 2**64 + 1 wraps around
+        with self.assertRaises(OverflowError):
+            add_mul(10 ** 20, 1)
+
 class TestIsSumEven(unittest.TestCase):
     def test_sum_even(self):
         self.assertEqual(is_sum_even(2, 4), 1)
@@ -19,6 +30,23 @@ class TestIsSumEven(unittest.TestCase):
     def test_sum_odd(self):
         self.assertEqual(is_sum_even(2, 3), 0)
 
+class TestIsSumEvenV(unittest.TestCase):
+    def test_sum_even(self):
+        self.assertEqual(is_sum_even_v(2, 4), 1)
+
+    def test_sum_odd(self):
+        self.assertEqual(is_sum_even_v(2, 3), 0)
+
+    def test_floats_truncate(self):
+        self.assertEqual(is_sum_even_v(2.5, 3.5), 0)
+
+    @unittest.skipUnless(importlib.util.find_spec('numba') and importlib.util.find_spec('numpy'),
+                         'is_sum_even_v is only a ufunc when numba is installed')
+    def test_arrays(self):
+        import numpy as np
+        result = is_sum_even_v(np.array([2, 2, 3]), np.array([4, 3, 5]))
+        self.assertEqual(result.tolist(), [1, 0, 1])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,133 @@
+import ast
+import importlib.util
+import os
+import unittest
+
+# rrt-tool.py is a script (hyphenated name), so load it from its path
+_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'rrt-tool.py')
+_spec = importlib.util.spec_from_file_location('rrt_tool', _path)
+rrt_tool = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(rrt_tool)
+
+SIMPLE = b"""def add_mul(a, b):
+    if a > b:
+        return a * b + 1
+    else:
+        return a + b
+"""
+
+
+class TestMiniParse(unittest.TestCase):
+    def test_simple_shape(self):
+        info = rrt_tool.mini_parse(SIMPLE)
+        self.assertEqual(info['name'], 'add_mul')
+        self.assertEqual(info['args'], ['a', 'b'])
+        self.assertEqual((info['cond'], info['true'], info['false']),
+                         ('a > b', 'a * b + 1', 'a + b'))
+
+    def test_docstring_is_skipped(self):
+        src = SIMPLE.replace(b'(a, b):\n', b'(a, b):\n    """\n    Doc.\n    """\n')
+        self.assertEqual(rrt_tool.mini_parse(src)['cond'], 'a > b')
+
+    def test_selects_named_function(self):
+        src = SIMPLE + b'\n\n' + SIMPLE.replace(b'add_mul', b'other').replace(b'a > b', b'a < b')
+        self.assertEqual(rrt_tool.mini_parse(src, 'other')['cond'], 'a < b')
+
+    def test_comment_falls_back(self):
+        self.assertIsNone(rrt_tool.mini_parse(SIMPLE.replace(b'a > b:', b'a > b:  # why')))
+
+    def test_semicolon_falls_back(self):
+        self.assertIsNone(rrt_tool.mini_parse(SIMPLE.replace(b'a + b\n', b'a + b; x = 1\n')))
+
+    def test_invalid_expression_falls_back(self):
+        self.assertIsNone(rrt_tool.mini_parse(SIMPLE.replace(b'a + b\n', b'a +\n')))
+
+    def test_coding_cookie(self):
+        src = b'# -*- coding: latin-1 -*-\n' + SIMPLE.replace(b'(a, b):\n', b'(a, b):\n    """caf\xe9"""\n')
+        self.assertEqual(rrt_tool.mini_parse(src)['name'], 'add_mul')
+
+    def test_bad_encoding_falls_back(self):
+        src = SIMPLE.replace(b'(a, b):\n', b'(a, b):\n    """caf\xe9"""\n')
+        self.assertIsNone(rrt_tool.mini_parse(src))
+
+    def test_def_inside_string_is_ignored(self):
+        decoy = SIMPLE.replace(b'add_mul', b'decoy')
+        src = b'NOTES = """\n' + decoy + b'"""\n\n\n' + SIMPLE
+        self.assertEqual(rrt_tool.mini_parse(src)['name'], 'add_mul')
+
+    def test_flat_indentation_falls_back(self):
+        src = SIMPLE.replace(b'        return a * b + 1', b'    return a * b + 1')
+        self.assertIsNone(rrt_tool.mini_parse(src))
+
+    def test_invalid_function_name_falls_back(self):
+        self.assertIsNone(rrt_tool.mini_parse(SIMPLE.replace(b'def add_mul', b'def 1add_mul')))
+
+    def test_keyword_argument_falls_back(self):
+        self.assertIsNone(rrt_tool.mini_parse(SIMPLE.replace(b'(a, b)', b'(a, class)')))
+
+    def test_syntax_error_elsewhere_is_raised(self):
+        with self.assertRaises(SyntaxError):
+            rrt_tool.mini_parse(SIMPLE + b'\nx = = 1\n')
+
+
+
+class TestScanIfReturn(unittest.TestCase):
+    def generated(self, template, cond='a > b', true_ret='a * b + 1', false_ret='a + b'):
+        return template.format(name='f', params='double a, double b', cond=cond,
+                               true_ret=true_ret, false_ret=false_ret)
+
+    def test_generated_c_and_java(self):
+        for template in (rrt_tool.C_TEMPLATE, rrt_tool.JAVA_TEMPLATE):
+            self.assertEqual(rrt_tool.scan_if_return(self.generated(template)),
+                             ('a > b', 'a * b + 1', 'a + b'))
+
+    def test_condition_ending_in_call(self):
+        for template in (rrt_tool.C_TEMPLATE, rrt_tool.JAVA_TEMPLATE):
+            text = self.generated(template, cond='a > g(b)', true_ret='g(a)')
+            self.assertEqual(rrt_tool.scan_if_return(text), ('a > g(b)', 'g(a)', 'a + b'))
+
+    def test_missing_anchor_returns_none(self):
+        text = 'if (a > b) { return a; } else { return b; }'
+        self.assertEqual(rrt_tool.scan_if_return(text), ('a > b', 'a', 'b'))
+        for broken in ('while (a > b) { return a; } else { return b; }',  # no 'if ('
+                       'if (a > b) return a; else return b;',              # no ') {'
+                       'if (a > b) { a; } else { return b; }',             # no first 'return '
+                       'if (a > b) { return a }',                          # no first ';'
+                       'if (a > b) { return a; } { return b; }',           # no 'else'
+                       'if (a > b) { return a; } else { b; }',             # no second 'return '
+                       'if (a > b) { return a; } else { return b }'):      # no second ';'
+            self.assertIsNone(rrt_tool.scan_if_return(broken), broken)
+
+
+class TestRenderExpr(unittest.TestCase):
+    def assertRendersLikeUnparse(self, src):
+        expr = ast.parse(src, mode='eval').body
+        self.assertEqual(rrt_tool.render_expr(expr), ast.unparse(expr))
+
+    def test_associativity(self):
+        for src in ('a - (b - c)', '(a - b) - c', 'a * (b * c)', 'a / b // c % d'):
+            self.assertRendersLikeUnparse(src)
+
+    def test_precedence(self):
+        for src in ('a * b + 1', 'a * (b + c)', '(int(a) + int(b)) % 2 == 0'):
+            self.assertRendersLikeUnparse(src)
+
+    def test_comparison_inside_arithmetic(self):
+        self.assertRendersLikeUnparse('a + (b < c)')
+        self.assertRendersLikeUnparse('(a < b) < c')
+
+    def test_fallback_operands_are_parenthesized(self):
+        # Unary and ** go through ast.unparse and are wrapped when nested;
+        # the result may carry extra parentheses but must mean the same
+        for src, expected in (('-a * b', '(-a) * b'), ('2 ** 3 + 1', '(2 ** 3) + 1'),
+                              ('a - -1', 'a - (-1)'), ('f(a + b) * c', 'f(a + b) * c')):
+            self.assertEqual(rrt_tool.render_expr(ast.parse(src, mode='eval').body), expected)
+
+    def test_big_int_and_inf_constants(self):
+        self.assertRendersLikeUnparse('a > ' + '9' * 400)
+        self.assertRendersLikeUnparse('1e999 * a')
+        self.assertRendersLikeUnparse('1.5 * a')
+
+
+if __name__ == '__main__':
+    unittest.main()